@@ -0,0 +1,98 @@
+# analysis_models.py
+# DSLModel result models and the pure parsing helpers that turn raw LLM output into response sections.
+# Kept free of import-time side effects (no LLM client, settings or app) so process-pool workers can import it cheaply.
+
+import re
+from functools import lru_cache
+from typing import List
+
+import orjson
+from dslmodel import DSLModel
+from pydantic import Field
+
+# Every item of the model's batched JSON must be an object with all of these keys
+BATCH_ANALYSIS_KEYS = frozenset({"entities", "relationships", "sentiment", "confidence", "summary"})
+
+# Identical LLM outputs (common at temperature 0) are parsed once; results are tuples so they can be shared safely
+@lru_cache(maxsize=1024)
+def _parse_lines(text):
+    return tuple(s for s in (line.strip() for line in text.splitlines()) if s)
+
+# Entity Extraction Model (DSLModel)
+class EntityExtractorModel(DSLModel):
+    entities: List[str] = Field(default_factory=list, description="List of entities and their types")
+    relationships: List[str] = Field(default_factory=list, description="Relationships between the entities")
+
+    @classmethod
+    def parse_output(cls, entities, relationships):
+        if isinstance(entities, str):
+            entities = list(_parse_lines(entities))
+        if isinstance(relationships, str):
+            relationships = list(_parse_lines(relationships))
+        return cls(entities=entities or [], relationships=relationships or [])
+
+# Matches the first number in the model's confidence text, e.g. "0.85" in "Confidence: 0.85"
+_CONFIDENCE_RE = re.compile(r'\d+(?:\.\d+)?')
+
+@lru_cache(maxsize=1024)
+def _parse_confidence(text):
+    confidence_match = _CONFIDENCE_RE.search(text)
+    return float(confidence_match.group()) if confidence_match else 0.0
+
+# Sentiment Analysis Model (DSLModel)
+class SentimentAnalyzerModel(DSLModel):
+    sentiment: str = Field("", description="The sentiment of the document (positive, negative, or neutral)")
+    confidence: float = Field(0.0, description="The confidence score of the sentiment analysis (0-1)")
+
+    @classmethod
+    def parse_output(cls, sentiment, confidence):
+        if isinstance(confidence, str):
+            confidence = _parse_confidence(confidence)
+        return cls(sentiment=sentiment, confidence=confidence)
+
+# Summarization Model (DSLModel)
+class SummarizerModel(DSLModel):
+    summary: str = Field("", description="10 words or less summary")
+
+# Build the response sections shared by the combined, batched and per-task calls
+def entity_section(entities, relationships):
+    entity_model = EntityExtractorModel.parse_output(entities, relationships)
+    return {
+        "entities": entity_model.entities,
+        "relationships": entity_model.relationships
+    }
+
+def sentiment_section(sentiment, confidence):
+    sentiment_model = SentimentAnalyzerModel.parse_output(sentiment, confidence)
+    return {
+        "sentiment": sentiment_model.sentiment,
+        "confidence": sentiment_model.confidence
+    }
+
+def summary_section(summary):
+    summary_model = SummarizerModel(summary=summary)
+    return {
+        "summary": summary_model.summary
+    }
+
+def parse_combined(entities, relationships, sentiment, confidence, summary):
+    return {
+        "entity_extraction": entity_section(entities, relationships),
+        "sentiment_analysis": sentiment_section(sentiment, confidence),
+        "summarization": summary_section(summary)
+    }
+
+def parse_batch(analyses, count):
+    # Tolerate prose or code fences around the JSON array
+    start, end = analyses.find('['), analyses.rfind(']')
+    analyses = orjson.loads(analyses[start:end + 1])
+    if not isinstance(analyses, list) or len(analyses) != count:
+        raise ValueError(f"Expected {count} analyses, got {len(analyses) if isinstance(analyses, list) else 0}")
+
+    responses = []
+    for i, analysis in enumerate(analyses, 1):
+        if not isinstance(analysis, dict) or not BATCH_ANALYSIS_KEYS <= analysis.keys():
+            raise ValueError(f"Analysis {i} is not an object with the keys {', '.join(sorted(BATCH_ANALYSIS_KEYS))}")
+        responses.append(parse_combined(analysis["entities"], analysis["relationships"], analysis["sentiment"],
+                                        analysis["confidence"], analysis["summary"]))
+    return responses
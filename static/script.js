@@ -1,33 +1,81 @@
 
 document.addEventListener('DOMContentLoaded', function() {
+    const sections = {
+        entity_extraction: {
+            title: 'Entity Extraction',
+            render: data => `<p>Entities: ${data.entities}</p><p>Relationships: ${data.relationships}</p>`
+        },
+        sentiment_analysis: {
+            title: 'Sentiment Analysis',
+            render: data => `<p>Sentiment: ${data.sentiment}</p><p>Confidence: ${data.confidence}</p>`
+        },
+        summarization: {
+            title: 'Summarization',
+            render: data => `<p>Summary: ${data.summary}</p>`
+        }
+    };
+
+    function renderSection(key, data) {
+        const section = sections[key];
+        const body = data.error ? `<p>${data.error}</p>` : section.render(data);
+        document.getElementById(key).innerHTML = `<h4>${section.title}:</h4>` + body;
+    }
+
+    // Each Server-Sent Event carries one finished analysis, e.g. {"summarization": {...}}
+    function handleEvents(chunk) {
+        chunk.split('\n\n').forEach(event => {
+            const payload = event.split('\n')
+                .filter(line => line.startsWith('data: '))
+                .map(line => line.slice(6))
+                .join('\n');
+            if (payload) {
+                Object.entries(JSON.parse(payload)).forEach(([key, data]) => renderSection(key, data));
+            }
+        });
+    }
+
     document.getElementById('analyzeButton').addEventListener('click', function() {
         const documentInput = document.getElementById('document').value;
-        fetch('/analyze', {
+        const resultsElement = document.getElementById('results');
+        // EventSource only supports GET, so read the event stream from a POST response body instead
+        fetch('/analyze_stream', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json'
             },
             body: JSON.stringify({ document: documentInput })
         })
-        .then(response => response.json())
-        .then(data => {
+        .then(async response => {
             let results = `<h3>Analysis Results:</h3>`;
-            if (data.error) {
-                results += `<p>${data.error}</p>`;
-            } else {
-                results += `<h4>Entity Extraction:</h4>`;
-                results += `<p>Entities: ${data.entity_extraction.entities}</p>`;
-                results += `<p>Relationships: ${data.entity_extraction.relationships}</p>`;
-                results += `<h4>Sentiment Analysis:</h4>`;
-                results += `<p>Sentiment: ${data.sentiment_analysis.sentiment}</p>`;
-                results += `<p>Confidence: ${data.sentiment_analysis.confidence}</p>`;
-                results += `<h4>Summarization:</h4>`;
-                results += `<p>Summary: ${data.summarization.summary}</p>`;
+            if (!response.headers.get('Content-Type').startsWith('text/event-stream')) {
+                const data = await response.json();
+                resultsElement.innerHTML = results + `<p>${data.error}</p>`;
+                return;
+            }
+            Object.entries(sections).forEach(([key, section]) => {
+                results += `<div id="${key}"><h4>${section.title}:</h4><p>Analyzing...</p></div>`;
+            });
+            resultsElement.innerHTML = results;
+
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            while (true) {
+                const { done, value } = await reader.read();
+                if (done) {
+                    break;
+                }
+                buffer += decoder.decode(value, { stream: true });
+                const end = buffer.lastIndexOf('\n\n');
+                if (end !== -1) {
+                    handleEvents(buffer.slice(0, end));
+                    buffer = buffer.slice(end + 2);
+                }
             }
-            document.getElementById('results').innerHTML = results;
+            handleEvents(buffer);
         })
         .catch(error => {
-            document.getElementById('results').innerHTML = `<p>Error: ${error}</p>`;
+            resultsElement.innerHTML = `<p>Error: ${error}</p>`;
         });
     });
 });